@@ -1,17 +1,64 @@
-import base64
+import asyncio
 import io
 import os
-import openai
-import pyautogui
 import threading
 import time
 
+from concurrent.futures import ThreadPoolExecutor
+
+# pybase64 provides a SIMD-accelerated drop-in replacement for the standard base64 module
+try:
+    import pybase64 as base64
+except ImportError:
+    import base64
+
+from PIL import Image
 from tkinter import Tk, ttk, Label, Canvas, Toplevel, Button
 from tkinter.scrolledtext import ScrolledText
-from pynput import keyboard
 
-# Initialize OpenAI API client using the API key from environment variables
-openai.api_key = os.environ.get("OPENAI_API_KEY")
+# openai, mss and pynput are slow to import, so they are imported where first used to keep startup fast
+
+# Longest edge (in pixels) of the image sent to the API; larger captures are downscaled
+MAX_IMAGE_EDGE = 1536
+
+# Regions whose longest edge is below this size are sent with low image detail
+LOW_DETAIL_MAX_EDGE = 800
+
+# Selections narrower or shorter than this (in pixels) are treated as misclicks and not analyzed
+MIN_REGION_SIZE = 32
+
+# Seconds to wait after closing the selection window so the compositor has removed it before capturing
+SELECTION_CLOSE_DELAY = 0.05
+
+# JPEG encoding settings: the starting quality is lowered step by step until the image fits the byte budget
+JPEG_QUALITY = 82
+JPEG_MIN_QUALITY = 40
+JPEG_QUALITY_STEP = 10
+MAX_IMAGE_BYTES = 512 * 1024
+
+# OpenAI request settings: transient failures are retried with exponential backoff (in seconds)
+API_TIMEOUT = 30
+API_MAX_ATTEMPTS = 3
+API_BACKOFF_BASE = 1
+API_BACKOFF_MAX = 10
+
+# Prompt for solving the coding problem in the image, sent with every request
+PROMPT = """
+You are a LeetCode coding problem solving master. 
+Please solve the coding question shown in the image by following these steps:
+1. Ask clarifying questions if any part of the problem is ambiguous.
+2. Explain your thought process, including the problem type (e.g., binary search, BFS, DP, etc.).
+3. Provide a complete Python implementation with clear comments. Use efficient algorithms (e.g., O(1) or O(n)) and avoid inefficient ones (e.g., O(n^2) or O(2^n)).
+4. Include multiple test cases to validate your solution.
+5. Summarize your solution with an explanation of its time and space complexity.
+
+Please refer below examples for naming conventions:
+- "l" and "r" for binary search boundaries.
+- "curr" for current.
+- "num" for number.
+- Always save the result to "res" variable if possible.
+- Avoid overly verbose or LLM-like naming.
+"""
 
 
 class ScreenMonitorTool:
@@ -24,9 +71,22 @@ class ScreenMonitorTool:
         output_label (Label): Label for the output section.
         output_text_box (ScrolledText): Scrollable text box to display analysis results.
         capture_button (Button): Button to initiate screenshot capture.
+        batch_button (Button): Button to capture a screenshot and add it to the pending batch.
+        submit_batch_button (Button): Button to analyze all batched screenshots in a single request.
         progress (ttk.Progressbar): Progress bar indicating ongoing processes.
         listener (keyboard.Listener): Listener for keyboard events.
+        _hotkey (keyboard.Key): The key that triggers screenshot selection.
         conversation_history (list): Stores the conversation context from previous interactions.
+        _img_buf (BytesIO): Reusable buffer whose leading bytes hold the encoded image of the current capture.
+        _aclient (openai.AsyncOpenAI): Async OpenAI client, created on first use and reused afterwards.
+        _loop (asyncio.AbstractEventLoop): Event loop running on a background thread that processes captures.
+        _capture_executor (ThreadPoolExecutor): Single persistent worker that captures and encodes screenshots.
+        _sct (mss.base.MSSBase): Screen grabber, created on first capture and reused afterwards.
+        _pending_images (list): Image message parts captured for the next batched request.
+        _batch_captures (set): Batch capture tasks still grabbing or encoding their screenshot.
+        _batch_selection (bool): Whether the current selection adds to the batch instead of being analyzed.
+        _busy (bool): Whether a capture or analysis is running; new ones are refused until it finishes.
+        _text_part (dict): The constant prompt message part shared by every request.
     """
 
     def __init__(self, master):
@@ -42,6 +102,31 @@ class ScreenMonitorTool:
         # Initialize conversation history for follow-up context
         self.conversation_history = []
 
+        # The prompt never changes, so build its message part once
+        self._text_part = {"type": "text", "text": PROMPT}
+
+        # Reuse a single image buffer across captures. It is overwritten but never truncated, so it keeps the
+        # capacity of the largest capture instead of being reallocated for each screenshot.
+        self._img_buf = io.BytesIO()
+
+        # Run a single event loop on a background thread so requests run off the Tk thread without a thread each
+        self._aclient = None
+        self._loop = asyncio.new_event_loop()
+        threading.Thread(target=self._loop.run_forever, daemon=True).start()
+
+        # Capture and encode on one persistent worker, keeping the CPU-bound image work off the event loop.
+        # Captures are queued and run one at a time, so the image buffer and screen grabber need no locking.
+        self._capture_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="capture")
+        self._sct = None
+
+        # Screenshots collected for a batched request; only touched from the event loop thread
+        self._pending_images = []
+        self._batch_captures = set()
+        self._batch_selection = False
+
+        # Only one capture or analysis runs at a time, so streamed output from two requests never interleaves
+        self._busy = False
+
         # Create GUI components
         self.label_info = Label(
             master, text="Press PgUp or use Screenshot button to ask a question"
@@ -61,11 +146,22 @@ class ScreenMonitorTool:
         )
         self.capture_button.pack(pady=5)
 
+        self.batch_button = Button(
+            master, text="Add to batch", command=lambda: self.initiate_selection(batch=True)
+        )
+        self.batch_button.pack(pady=5)
+
+        self.submit_batch_button = Button(
+            master, text="Submit batch", command=self.submit_batch
+        )
+        self.submit_batch_button.pack(pady=5)
+
         self.progress = ttk.Progressbar(master, mode='indeterminate')
         self.progress.pack(pady=10)
         self.progress.pack_forget()
 
-        self.start_listening()
+        # Start the keyboard listener once the window is up, so importing pynput does not delay it
+        self.master.after_idle(self.start_listening)
 
     def start_listening(self):
         """
@@ -74,6 +170,9 @@ class ScreenMonitorTool:
         self.show_output_text(
             'Monitoring active. Press PgUp or click "Screenshot" to select an area and analyze the image content.'
         )
+        from pynput import keyboard
+
+        self._hotkey = keyboard.Key.page_up
         self.listener = keyboard.Listener(on_press=self.on_key_press)
         self.listener.start()
 
@@ -86,48 +185,91 @@ class ScreenMonitorTool:
         Args:
             text (str): The text to display.
         """
+        self.reset_output()
+        self.append_output(text)
+
+    def reset_output(self):
+        """
+        Clears the output text box.
+        """
+        self.output_text_box.configure(state='normal')
         self.output_text_box.delete("1.0", "end")
+        self.output_text_box.configure(state='disabled')
+
+    def append_output(self, text):
+        """
+        Appends the given text to the output text box and scrolls to the end.
+        
+        Only inserts at the end, so streamed updates do not rebuild the existing text.
+        
+        Args:
+            text (str): The text to append.
+        """
+        self.output_text_box.configure(state='normal')
         self.output_text_box.insert("end", text)
+        self.output_text_box.configure(state='disabled')
         self.output_text_box.see("end")
 
     def show_loading(self, message):
         """
-        Displays a loading message and shows the progress bar.
+        Displays a loading message, shows the progress bar and disables the capture buttons until
+        hide_loading is called.
         
         Args:
             message (str): The loading message to display.
         """
+        self._set_busy(True)
         self.show_output_text(message)
         self.progress.pack(pady=10)
         self.progress.start(10)
 
     def hide_loading(self):
         """
-        Hides the loading progress bar.
+        Hides the loading progress bar and re-enables the capture buttons.
         """
+        self._set_busy(False)
         self.progress.stop()
         self.progress.pack_forget()
         self.master.update()
 
+    def _set_busy(self, busy):
+        """
+        Marks whether a capture or analysis is running and enables or disables the buttons accordingly.
+        
+        Args:
+            busy (bool): True while a capture or analysis is running.
+        """
+        self._busy = busy
+        state = 'disabled' if busy else 'normal'
+        for button in (self.capture_button, self.batch_button, self.submit_batch_button):
+            button.configure(state=state)
+
     def on_key_press(self, key):
         """
         Handles key press events.
         
-        If the Page Up key is pressed, initiates screenshot selection.
+        If the Page Up key is pressed, initiates screenshot selection. This runs on the pynput listener thread
+        for every key pressed anywhere in the OS, so it only does an identity check and hands the selection
+        over to the Tk thread.
         
         Args:
             key (keyboard.Key): The key that was pressed.
         """
-        try:
-            if key == keyboard.Key.page_up:
-                self.initiate_selection()
-        except AttributeError:
-            pass
+        if key is self._hotkey:
+            self.master.after(0, self.initiate_selection)
 
-    def initiate_selection(self):
+    def initiate_selection(self, batch=False):
         """
         Initiates the area selection for screenshot capture by opening a transparent fullscreen window.
+        
+        Args:
+            batch (bool, optional): If True, the selected screenshot is added to the batch instead of analyzed.
         """
+        # The hotkey still fires while a request is running; ignore it until the request finishes
+        if self._busy:
+            return
+
+        self._batch_selection = batch
         self.show_output_text("Please select the screenshot area...")
         self.selection_window = Toplevel(self.master)
         self.selection_window.attributes("-fullscreen", True)
@@ -190,6 +332,9 @@ class ScreenMonitorTool:
         end_x, end_y = event.x, event.y
         self.selection_window.destroy()
 
+        # Flush the window unmap now so the capture only has to wait for the compositor
+        self.master.update_idletasks()
+
         # Calculate the selected region coordinates and dimensions
         region = (
             min(self.start_x, end_x),
@@ -197,22 +342,28 @@ class ScreenMonitorTool:
             abs(self.start_x - end_x),
             abs(self.start_y - end_y),
         )
-        self.capture_and_process(region)
+
+        # Skip the capture and API call for clicks without a meaningful drag
+        if region[2] < MIN_REGION_SIZE or region[3] < MIN_REGION_SIZE:
+            self.show_output_text("Selection too small; canceled.")
+            return
+
+        if self._batch_selection:
+            self.add_to_batch(region)
+        else:
+            self.capture_and_process(region)
 
     def capture_and_process(self, region):
         """
-        Displays a loading message and starts a new thread to capture and process the screenshot.
+        Displays a loading message and schedules the screenshot capture and processing on the background event loop.
         
         Args:
             region (tuple): The region of the screen to capture (x, y, width, height).
         """
         self.show_loading("Taking screenshot and analyzing image content...")
-        thread = threading.Thread(
-            target=self._capture_and_process_thread, args=(region,)
-        )
-        thread.start()
+        asyncio.run_coroutine_threadsafe(self._capture_and_process(region), self._loop)
 
-    def _capture_and_process_thread(self, region):
+    async def _capture_and_process(self, region):
         """
         Captures the screenshot of the specified region and processes it using OpenAI's API.
         
@@ -220,142 +371,295 @@ class ScreenMonitorTool:
             region (tuple): The region of the screen to capture (x, y, width, height).
         """
         try:
-            # Delay to avoid capturing the transparent selection window
-            time.sleep(0.5)
-            screenshot = pyautogui.screenshot(region=region)
-            img_bytes = io.BytesIO()
-            screenshot.save(img_bytes, format='PNG')
-            img_bytes.seek(0)
+            image_part = await self._capture_image(region)
 
             # Send the image to OpenAI for analysis
-            analysis = self.analyze_image(img_bytes)
-            self.show_output_text(f"Result:\n{analysis}")
+            analysis = await self.analyze_image([image_part])
+            self.master.after(0, self.show_output_text, f"Result:\n{analysis}")
+            print(f"Result:\n{analysis}")
+        except Exception as e:
+            self.master.after(0, self.show_output_text, f"Image analysis error: {e}")
+        finally:
+            self.master.after(0, self.hide_loading)
+
+    def add_to_batch(self, region):
+        """
+        Displays a loading message and schedules the screenshot capture of the region into the pending batch.
+        
+        Args:
+            region (tuple): The region of the screen to capture (x, y, width, height).
+        """
+        self.show_loading("Taking screenshot and adding it to the batch...")
+        asyncio.run_coroutine_threadsafe(self._capture_to_batch(region), self._loop)
+
+    async def _capture_to_batch(self, region):
+        """
+        Captures the screenshot of the specified region and appends it to the pending batch.
+        
+        Args:
+            region (tuple): The region of the screen to capture (x, y, width, height).
+        """
+        task = asyncio.current_task()
+        self._batch_captures.add(task)
+        try:
+            # Append only after the capture completes, so a batch submitted meanwhile cannot swap the list out
+            image_part = await self._capture_image(region)
+            self._pending_images.append(image_part)
+            self.master.after(
+                0,
+                self.show_output_text,
+                f'Screenshot added to batch ({len(self._pending_images)} pending). '
+                'Click "Submit batch" to analyze them together.',
+            )
+        except Exception as e:
+            self.master.after(0, self.show_output_text, f"Screenshot capture error: {e}")
+        finally:
+            self._batch_captures.discard(task)
+            self.master.after(0, self.hide_loading)
+
+    def submit_batch(self):
+        """
+        Displays a loading message and schedules the analysis of all batched screenshots on the background event loop.
+        """
+        if self._busy:
+            return
+
+        self.show_loading("Analyzing batched screenshots...")
+        asyncio.run_coroutine_threadsafe(self._process_batch(), self._loop)
+
+    async def _process_batch(self):
+        """
+        Sends all pending screenshots to OpenAI's API in a single request and clears the batch.
+        
+        If the request fails, the screenshots are put back into the batch so it can be submitted again.
+        """
+        image_parts = []
+        try:
+            # Wait for batch captures still in flight so their screenshots are included
+            if self._batch_captures:
+                await asyncio.gather(*self._batch_captures)
+
+            if not self._pending_images:
+                self.master.after(
+                    0, self.show_output_text, 'No screenshots in the batch. Use "Add to batch" first.'
+                )
+                return
+
+            image_parts, self._pending_images = self._pending_images, []
+            analysis = await self.analyze_image(image_parts)
+            self.master.after(0, self.show_output_text, f"Result:\n{analysis}")
             print(f"Result:\n{analysis}")
         except Exception as e:
-            self.show_output_text(f"Image analysis error: {e}")
+            # Keep the screenshots ahead of any added since, so a retry sends them again
+            self._pending_images[:0] = image_parts
+            self.master.after(
+                0,
+                self.show_output_text,
+                f"Image analysis error: {e}\n\n"
+                f'{len(self._pending_images)} screenshot(s) kept in the batch. Click "Submit batch" to retry.',
+            )
         finally:
-            self.hide_loading()
+            self.master.after(0, self.hide_loading)
+
+    async def _capture_image(self, region):
+        """
+        Captures the screenshot of the specified region and builds the image message part for the API.
+        
+        Args:
+            region (tuple): The region of the screen to capture (x, y, width, height).
+        
+        Returns:
+            dict: The "image_url" content part holding the base64-encoded JPEG screenshot.
+        """
+        # Short delay to avoid capturing the transparent selection window
+        await asyncio.sleep(SELECTION_CLOSE_DELAY)
 
-    def analyze_image(self, image_bytes):
+        return await self._loop.run_in_executor(self._capture_executor, self._grab_and_encode, region)
+
+    def _grab_and_encode(self, region):
         """
-        Analyzes the provided image by sending it to the OpenAI API to solve the coding question contained in the image.
+        Grabs the specified region of the screen and encodes it into an image message part.
+        
+        Runs on the capture worker thread.
+        
+        Args:
+            region (tuple): The region of the screen to capture (x, y, width, height).
+        
+        Returns:
+            dict: The "image_url" content part holding the base64-encoded JPEG screenshot.
+        """
+        # mss handles are bound to the thread that created them, so create it on the capture worker
+        if self._sct is None:
+            import mss
+
+            self._sct = mss.mss()
+        raw = self._sct.grab(
+            {"left": region[0], "top": region[1], "width": region[2], "height": region[3]}
+        )
+
+        # Let Pillow's C decoder convert the raw BGRA pixels instead of building RGB bytes via mss in Python
+        screenshot = Image.frombytes("RGB", raw.size, raw.bgra, "raw", "BGRX")
+
+        # Downscale large captures to keep the image payload and vision token usage bounded
+        screenshot.thumbnail((MAX_IMAGE_EDGE, MAX_IMAGE_EDGE), Image.Resampling.LANCZOS)
+        base64_image = self._encode_image(screenshot)
+
+        # Small regions do not benefit from high detail processing
+        detail = "low" if max(region[2], region[3]) < LOW_DETAIL_MAX_EDGE else "high"
+
+        return {
+            "type": "image_url",
+            "image_url": {
+                "url": f"data:image/jpeg;base64,{base64_image}",
+                "detail": detail,
+            },
+        }
+
+    def _encode_image(self, image):
+        """
+        Encodes the image as base64 JPEG using the shared image buffer.
+        
+        The JPEG quality is lowered until the encoded image fits within MAX_IMAGE_BYTES. The JPEG is written over
+        the start of the buffer; anything past the write position is stale data from earlier captures.
+        
+        Args:
+            image (PIL.Image.Image): The RGB image to encode.
+        
+        Returns:
+            str: The base64-encoded JPEG image.
+        """
+        img_bytes = self._img_buf
+        quality = JPEG_QUALITY
+        while True:
+            # Overwrite from the start instead of truncating, which would free the buffer's memory
+            img_bytes.seek(0)
+            image.save(img_bytes, format='JPEG', quality=quality, optimize=True)
+            size = img_bytes.tell()
+            if size < MAX_IMAGE_BYTES or quality <= JPEG_MIN_QUALITY:
+                break
+            quality = max(quality - JPEG_QUALITY_STEP, JPEG_MIN_QUALITY)
+
+        # Encode only the JPEG bytes, straight from the buffer without copying them first
+        with img_bytes.getbuffer() as image_view, image_view[:size] as jpeg_view:
+            return base64.b64encode(jpeg_view).decode("ascii")
+
+    async def analyze_image(self, image_parts):
+        """
+        Analyzes the provided images by sending them to the OpenAI API in a single request to solve the coding question
+        contained in the images.
         
         This method preserves conversation context across multiple requests. The conversation history is
         combined with the new request so that previous interactions are considered in the analysis.
         
         The function follows these steps:
-        1. Shows a loading message.
-        2. Encodes the image in base64 format.
-        3. Constructs a prompt instructing the model to solve the coding problem by following a series of steps,
-           including clarifying questions, explaining the thought process, providing a Python implementation with 
-           efficient algorithm recommendations, including test cases, and summarizing the time and space complexity.
-        4. Combines previous conversation history with the new user message (which includes the image).
-        5. Sends the combined messages to the OpenAI API.
-        6. Measures the API call duration and extracts the total token usage from the response.
-        7. Appends the new user message and the assistant's reply to the conversation history.
-        8. Returns the response content along with API execution time and token usage information.
+        1. Shows an analyzing message (the caller owns the progress bar).
+        2. Builds the user message from the constant PROMPT part, which instructs the model to solve the coding
+           problem by following a series of steps, including clarifying questions, explaining the thought process,
+           providing a Python implementation with efficient algorithm recommendations, including test cases, and
+           summarizing the time and space complexity.
+        3. Combines previous conversation history with the new user message (which includes the images).
+        4. Sends the combined messages to the OpenAI API, retrying transient errors with exponential backoff.
+        5. Streams the response into the output text box, measuring the API call duration and extracting
+           the total token usage from the final chunk.
+        6. Appends the new user message and the assistant's reply to the conversation history.
+        7. Returns the response content along with API execution time and token usage information.
         
         Args:
-            image_bytes (BytesIO): The in-memory bytes of the image to be analyzed.
+            image_parts (list): The "image_url" content parts of the screenshots to be analyzed.
         
         Returns:
             str: The analysis result including the response content from the API, API call duration, and token usage.
-                 If an exception occurs, returns an error message.
+        
+        Raises:
+            Exception: If the request fails. Transient errors are raised as RuntimeError once API_MAX_ATTEMPTS
+                attempts have failed.
         """
-        try:
-            self.show_loading("Analyzing the image, please wait...")
-
-            # Initialize OpenAI client
-            client = openai.OpenAI()
-
-            # Encode the image to base64
-            base64_image = base64.b64encode(image_bytes.getvalue()).decode("utf-8")
-
-            # Define the prompt for solving the coding problem in the image
-            prompt = """
-            You are a LeetCode coding problem solving master. 
-            Please solve the coding question shown in the image by following these steps:
-            1. Ask clarifying questions if any part of the problem is ambiguous.
-            2. Explain your thought process, including the problem type (e.g., binary search, BFS, DP, etc.).
-            3. Provide a complete Python implementation with clear comments. Use efficient algorithms (e.g., O(1) or O(n)) and avoid inefficient ones (e.g., O(n^2) or O(2^n)).
-            4. Include multiple test cases to validate your solution.
-            5. Summarize your solution with an explanation of its time and space complexity.
-
-            Please refer below examples for naming conventions:
-            - "l" and "r" for binary search boundaries.
-            - "curr" for current.
-            - "num" for number.
-            - Always save the result to "res" variable if possible.
-            - Avoid overly verbose or LLM-like naming.
-            """
-
-            # Build new user message with text and the encoded image
-            new_message = {
-                "role": "user",
+        # Runs on the event loop thread, so Tk updates are scheduled on the Tk thread
+        self.master.after(0, self.show_output_text, "Analyzing the image, please wait...")
+
+        import openai
+
+        # Initialize the OpenAI client once, using the API key from environment variables, and reuse it
+        # (and its connection pool) for later requests. Retries are handled below, so the client's own
+        # retries are disabled.
+        if self._aclient is None:
+            self._aclient = openai.AsyncOpenAI(
+                api_key=os.environ.get("OPENAI_API_KEY"), timeout=API_TIMEOUT, max_retries=0
+            )
+        client = self._aclient
+
+        # Build new user message with the prompt and the encoded images
+        new_message = {"role": "user", "content": [self._text_part, *image_parts]}
+
+        # Combine previous conversation history with the new message
+        messages = self.conversation_history + [new_message]
+
+        # Record the start time for API call timing
+        start_time = time.time()
+
+        # Send the request to OpenAI's chat completions API with the conversation context,
+        # retrying rate limits, timeouts, connection and server errors
+        for attempt in range(1, API_MAX_ATTEMPTS + 1):
+            try:
+                response = await client.chat.completions.create(
+                    model="o1",  # Adjust the model name as per your usage
+                    messages=messages,
+                    stream=True,
+                    stream_options={"include_usage": True},
+                )
+                break
+            except (
+                openai.RateLimitError,
+                openai.APITimeoutError,
+                openai.APIConnectionError,
+                openai.InternalServerError,
+            ) as e:
+                if attempt == API_MAX_ATTEMPTS:
+                    raise RuntimeError(f"Failed after {attempt} attempts: {e}") from e
+                await asyncio.sleep(min(API_BACKOFF_BASE * 2 ** (attempt - 1), API_BACKOFF_MAX))
+
+        # Stream the response into the output text box as it arrives.
+        # Token usage is reported in the final chunk, which carries no choices.
+        self.master.after(0, self.show_output_text, "Result:\n")
+        content_parts = []
+        total_tokens = "N/A"
+        async for chunk in response:
+            if chunk.usage is not None:
+                total_tokens = chunk.usage.total_tokens
+            if not chunk.choices:
+                continue
+            delta = chunk.choices[0].delta.content
+            if delta:
+                content_parts.append(delta)
+                self.master.after(0, self.append_output, delta)
+
+        # Calculate the elapsed time for the API call
+        elapsed_time = time.time() - start_time
+
+        response_content = "".join(content_parts).strip()
+
+        # Append API call duration and token usage information to the response content
+        analysis_result = (
+            f"{response_content}\n\nAPI call duration: {elapsed_time:.2f} seconds\nToken usage: {total_tokens}"
+        )
+        print(analysis_result)
+
+        # Append the new user message and assistant's reply to the conversation history for follow-up context
+        self.conversation_history.extend([
+            new_message,
+            {
+                "role": "assistant",
                 "content": [
                     {
                         "type": "text",
-                        "text": prompt,
-                    },
-                    {
-                        "type": "image_url",
-                        "image_url": {
-                            "url": f"data:image/jpeg;base64,{base64_image}"
-                        },
-                    },
+                        "text": response_content,
+                    }
                 ],
             }
+        ])
 
-            # Combine previous conversation history with the new message
-            messages = self.conversation_history + [new_message]
-
-            # Record the start time for API call timing
-            start_time = time.time()
-
-            # Send the request to OpenAI's chat completions API with the conversation context
-            response = client.chat.completions.create(
-                model="o1",  # Adjust the model name as per your usage
-                messages=messages,
-            )
-
-            # Calculate the elapsed time for the API call
-            elapsed_time = time.time() - start_time
+        return analysis_result
 
-            # Access token usage information if available, else default to "N/A"
-            total_tokens = (
-                response.usage.total_tokens if hasattr(response, "usage") and response.usage is not None
-                else "N/A"
-            )
-
-            # Extract the response content from the API result
-            response_content = response.choices[0].message.content.strip()
-
-            # Append API call duration and token usage information to the response content
-            analysis_result = (
-                f"{response_content}\n\nAPI call duration: {elapsed_time:.2f} seconds\nToken usage: {total_tokens}"
-            )
-            print(analysis_result)
-
-            # Append the new user message and assistant's reply to the conversation history for follow-up context
-            self.conversation_history.extend([
-                new_message,
-                {
-                    "role": "assistant",
-                    "content": [
-                        {
-                            "type": "text",
-                            "text": response_content,
-                        }
-                    ],
-                }
-            ])
-
-            return analysis_result
-
-        except Exception as e:
-            return f"Error: {e}"
-        finally:
-            self.hide_loading()
 
 
 # Main program execution